@@ -1,79 +1,141 @@
 #!/usr/bin/env python3
 """
 Batch scraper for managing multiple Substack subscriptions.
-Reads from subscriptions.json and scrapes all enabled subscriptions sequentially.
+Reads from subscriptions.json and scrapes all enabled subscriptions, running
+different Substack hosts in parallel.
 """
 
 import argparse
+import asyncio
+import contextlib
 import json
+import logging
 import os
 import sys
-from datetime import datetime, timedelta
-from time import sleep
-from typing import Dict, List, Optional
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, urlsplit, urlunsplit
 
-from scrape_manager import initial_scrape, update_scrape, get_last_12_months_date
-from config import EMAIL, PASSWORD
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from dateutils import iso_date
+from logutils import make_logger
 
 
 SUBSCRIPTIONS_FILE = "subscriptions.json"
 
+# Batch progress goes through one logger/handler so parallel scrapes don't interleave output
+logger = make_logger("batch_scraper", logging.StreamHandler(sys.stdout))
+
+# In-process cache of the parsed subscriptions file, keyed by its mtime
+_CACHE = {"mtime": None, "data": None}
+
+
+def _canonicalize(url: str) -> str:
+    """Normalize a Substack URL to https://host[/path] so variants of it compare equal."""
+    url = url.strip()
+    parts = urlsplit(url)
+    if not parts.netloc:
+        # e.g. "example.substack.com" given without a scheme
+        parts = urlsplit(f"https://{url}")
+    return urlunsplit(("https", parts.netloc.lower(), parts.path.rstrip("/"), "", ""))
+
 
 def load_subscriptions() -> Dict:
-    """Load subscriptions from JSON file."""
+    """Load subscriptions from JSON file, reusing the cached copy if unchanged."""
     if not os.path.exists(SUBSCRIPTIONS_FILE):
         print(f"Error: {SUBSCRIPTIONS_FILE} not found!")
         print("Creating a default subscriptions file...")
-        create_default_subscriptions()
-        return load_subscriptions()
+        return create_default_subscriptions()
     
+    mtime = os.stat(SUBSCRIPTIONS_FILE).st_mtime_ns
+    if _CACHE["data"] is not None and _CACHE["mtime"] == mtime:
+        return _CACHE["data"]
+
     with open(SUBSCRIPTIONS_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        data = orjson.loads(f.read()) if orjson else json.load(f)
+
+    # Migrate the old list-based schema to subscriptions keyed by URL
+    subscriptions = data.get("subscriptions", {})
+    if isinstance(subscriptions, list):
+        subscriptions = {
+            sub["url"]: {k: v for k, v in sub.items() if k != "url"}
+            for sub in subscriptions
+        }
+
+    # Key by canonical URL, keeping the first entry when variants collide
+    canonical = {}
+    for url, sub in subscriptions.items():
+        canonical.setdefault(_canonicalize(url), sub)
+
+    if list(canonical) != list(data.get("subscriptions", [])):
+        data["subscriptions"] = canonical
+        save_subscriptions(data)
+        return data
+
+    _CACHE["mtime"] = mtime
+    _CACHE["data"] = data
+    return data
 
 
 def save_subscriptions(data: Dict) -> None:
-    """Save subscriptions to JSON file."""
-    with open(SUBSCRIPTIONS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    """
+    Save subscriptions to JSON file and refresh the cache.
+
+    The data is serialized up front and written to a temporary file in one
+    call, then moved into place so an interrupted save never leaves a
+    truncated subscriptions file behind.
+    """
+    tmp_file = SUBSCRIPTIONS_FILE + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        if orjson:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode())
+        else:
+            f.write(json.dumps(data, indent=2, ensure_ascii=False))
+    os.replace(tmp_file, SUBSCRIPTIONS_FILE)
+    _CACHE["mtime"] = os.stat(SUBSCRIPTIONS_FILE).st_mtime_ns
+    _CACHE["data"] = data
 
 
-def create_default_subscriptions() -> None:
-    """Create a default subscriptions.json file."""
+def create_default_subscriptions() -> Dict:
+    """Create a default subscriptions.json file and return its contents."""
     default_data = {
-        "subscriptions": [],
+        "subscriptions": {},
         "settings": {
             "default_start_date": None,
             "auto_detect_premium": True,
-            "delay_between_substacks": 10
+            "delay_between_substacks": 10,
+            "max_parallel": 4
         }
     }
     save_subscriptions(default_data)
     print(f"Created {SUBSCRIPTIONS_FILE} - please add your subscriptions to this file.")
+    return default_data
 
 
 def add_subscription(url: str, name: Optional[str] = None, premium: bool = False) -> None:
     """Add a new subscription to the list."""
     data = load_subscriptions()
+    url = _canonicalize(url)
     
     # Check if already exists
-    for sub in data["subscriptions"]:
-        if sub["url"] == url:
-            print(f"Subscription already exists: {url}")
-            return
+    if url in data["subscriptions"]:
+        print(f"Subscription already exists: {url}")
+        return
     
     # Extract name from URL if not provided
     if not name:
         from substack_scraper_enhanced import extract_main_part
         name = extract_main_part(url)
     
-    new_sub = {
-        "url": url,
+    data["subscriptions"][url] = {
         "name": name,
         "premium": premium,
         "enabled": True
     }
-    
-    data["subscriptions"].append(new_sub)
     save_subscriptions(data)
     print(f"Added subscription: {name} ({url})")
 
@@ -81,11 +143,9 @@ def add_subscription(url: str, name: Optional[str] = None, premium: bool = False
 def remove_subscription(url: str) -> None:
     """Remove a subscription from the list."""
     data = load_subscriptions()
-    original_count = len(data["subscriptions"])
-    
-    data["subscriptions"] = [s for s in data["subscriptions"] if s["url"] != url]
+    url = _canonicalize(url)
     
-    if len(data["subscriptions"]) < original_count:
+    if data["subscriptions"].pop(url, None) is not None:
         save_subscriptions(data)
         print(f"Removed subscription: {url}")
     else:
@@ -104,11 +164,11 @@ def list_subscriptions() -> None:
     print("\nConfigured Subscriptions:")
     print("-" * 60)
     
-    for i, sub in enumerate(data["subscriptions"], 1):
+    for i, (url, sub) in enumerate(data["subscriptions"].items(), 1):
         status = "✓ Enabled" if sub.get("enabled", True) else "✗ Disabled"
         premium = "Premium" if sub.get("premium", False) else "Free"
         print(f"{i}. {sub['name']}")
-        print(f"   URL: {sub['url']}")
+        print(f"   URL: {url}")
         print(f"   Status: {status} | Type: {premium}")
         print()
     
@@ -119,27 +179,68 @@ def list_subscriptions() -> None:
     print("\nSettings:")
     print(f"  Default start date: {settings.get('default_start_date', 'Last 12 months')}")
     print(f"  Delay between substacks: {settings.get('delay_between_substacks', 10)} seconds")
+    print(f"  Max parallel substacks: {settings.get('max_parallel', 4)}")
 
 
 def toggle_subscription(url: str) -> None:
     """Enable/disable a subscription."""
     data = load_subscriptions()
+    url = _canonicalize(url)
     
-    for sub in data["subscriptions"]:
-        if sub["url"] == url:
-            sub["enabled"] = not sub.get("enabled", True)
-            save_subscriptions(data)
-            status = "enabled" if sub["enabled"] else "disabled"
-            print(f"Subscription {status}: {sub['name']}")
-            return
+    sub = data["subscriptions"].get(url)
+    if sub is None:
+        print(f"Subscription not found: {url}")
+        return
     
-    print(f"Subscription not found: {url}")
+    sub["enabled"] = not sub.get("enabled", True)
+    save_subscriptions(data)
+    status = "enabled" if sub["enabled"] else "disabled"
+    print(f"Subscription {status}: {sub['name']}")
+
+
+def _scrape_one(sub: Dict, mode: str, start_date: Optional[str],
+                headless: bool) -> Tuple[str, bool, Optional[str]]:
+    """
+    Scrape a single subscription. Premium subscriptions share one logged-in
+    browser session, so callers must not run two of them at once.
+
+    Returns:
+        Tuple of (name, success, error message or None)
+    """
+    # Imported here so commands that only edit subscriptions skip loading the scrapers
+    from scrape_manager import initial_scrape, update_scrape
+
+    is_premium = sub.get("premium", False)
+    try:
+        if mode == "initial":
+            success = initial_scrape(
+                url=sub["url"],
+                start_date=start_date,
+                premium=is_premium,
+                headless=headless,
+                reuse_session=True
+            )
+        else:  # update mode
+            success = update_scrape(
+                url=sub["url"],
+                premium=is_premium,
+                headless=headless,
+                reuse_session=True
+            )
+        return sub["name"], success, None
+    except Exception as e:
+        return sub["name"], False, str(e)
 
 
-def scrape_all(mode: str = "update", start_date: Optional[str] = None, 
-               headless: bool = True, dry_run: bool = False, premium_only: bool = False) -> None:
+async def scrape_all(mode: str = "update", start_date: Optional[str] = None,
+                     headless: bool = True, dry_run: bool = False, premium_only: bool = False) -> None:
     """
-    Scrape all enabled subscriptions sequentially.
+    Scrape all enabled subscriptions.
+
+    Different hosts are scraped in parallel (up to the ``max_parallel`` setting);
+    subscriptions on the same host run one at a time with the configured delay
+    between them. Premium subscriptions run one after another through a single
+    logged-in browser session, which is closed once the batch finishes.
     
     Args:
         mode: "initial" or "update"
@@ -148,30 +249,39 @@ def scrape_all(mode: str = "update", start_date: Optional[str] = None,
         dry_run: Show what would be scraped without actually doing it
     """
     data = load_subscriptions()
-    enabled_subs = [s for s in data["subscriptions"] if s.get("enabled", True)]
+    enabled_subs = [dict(sub, url=url) for url, sub in data["subscriptions"].items()
+                    if sub.get("enabled", True)]
     
     # Filter for premium only if requested
     if premium_only:
         enabled_subs = [s for s in enabled_subs if s.get("premium", False)]
-        print("Note: Scraping premium subscriptions only")
+        logger.info("Note: Scraping premium subscriptions only")
+
+    # Start premium subscriptions first: they share one session and run in sequence
+    enabled_subs.sort(key=lambda s: not s.get("premium", False))
     
     if not enabled_subs:
-        print("No enabled subscriptions to scrape.")
+        logger.warning("No enabled subscriptions to scrape.")
         return
     
     settings = data.get("settings", {})
     delay = settings.get("delay_between_substacks", 10)
+    # Guard against a hand-edited value below 1, which would stall every scrape
+    max_parallel = max(1, settings.get("max_parallel", 4))
     
     # Use provided start_date or fall back to settings or default
     if not start_date:
         start_date = settings.get("default_start_date")
     
-    print(f"\n{'DRY RUN - ' if dry_run else ''}Batch Scraping Started")
-    print("=" * 60)
-    print(f"Mode: {mode}")
-    print(f"Start date: {start_date or 'Last 12 months'}")
-    print(f"Subscriptions to scrape: {len(enabled_subs)}")
-    print("=" * 60)
+    logger.info("\n".join([
+        f"\n{'DRY RUN - ' if dry_run else ''}Batch Scraping Started",
+        "=" * 60,
+        f"Mode: {mode}",
+        f"Start date: {start_date or 'Last 12 months'}",
+        f"Subscriptions to scrape: {len(enabled_subs)}",
+        f"Max parallel: {max_parallel}",
+        "=" * 60,
+    ]))
     
     if dry_run:
         print("\nWould scrape the following:")
@@ -179,101 +289,147 @@ def scrape_all(mode: str = "update", start_date: Optional[str] = None,
             print(f"{i}. {sub['name']} - {sub['url']}")
         return
     
+    # Imported lazily: loading config reads .env and warns about missing credentials,
+    # which only matters when actually scraping
+    from config import EMAIL, PASSWORD
+
+    # Resolve the default cutoff once so every subscription in the batch shares it
+    if mode == "initial" and not start_date:
+        from scrape_manager import get_last_12_months_date
+        start_date = get_last_12_months_date()
+        logger.info(f"Using start date: {start_date}")
+
     successful = []
     failed = []
-    
-    for i, sub in enumerate(enabled_subs, 1):
-        print(f"\n[{i}/{len(enabled_subs)}] Scraping: {sub['name']}")
-        print("-" * 40)
-        
-        try:
-            if mode == "initial":
-                # Check credentials if premium
-                if sub.get("premium", False):
-                    if EMAIL == "your-email@domain.com" or PASSWORD == "your-password":
-                        print("✗ Skipping premium subscription - credentials not configured")
-                        print("  Set SUBSTACK_EMAIL and SUBSTACK_PASSWORD in .env file")
-                        failed.append(sub["name"])
-                        continue
-                
-                success = initial_scrape(
-                    url=sub["url"],
-                    start_date=start_date,
-                    premium=sub.get("premium", False),
-                    headless=headless
-                )
-            else:  # update mode
-                # Check credentials if premium
-                if sub.get("premium", False):
-                    if EMAIL == "your-email@domain.com" or PASSWORD == "your-password":
-                        print("✗ Skipping premium subscription - credentials not configured")
-                        print("  Set SUBSTACK_EMAIL and SUBSTACK_PASSWORD in .env file")
-                        failed.append(sub["name"])
-                        continue
-                
-                success = update_scrape(
-                    url=sub["url"],
-                    premium=sub.get("premium", False),
-                    headless=headless
-                )
-            
-            if success:
-                successful.append(sub["name"])
-                print(f"✓ Successfully scraped {sub['name']}")
-            else:
-                failed.append(sub["name"])
-                print(f"✗ Failed to scrape {sub['name']}")
-                
-        except Exception as e:
+    credentials_configured = EMAIL != "your-email@domain.com" and PASSWORD != "your-password"
+
+    # Bound overall concurrency, and keep scraping of a single host (and of the
+    # shared premium session) sequential. Premium subscriptions hold both locks,
+    # always taken in this order: premium session first, then host.
+    def lock_keys(sub: Dict) -> List[str]:
+        host = urlparse(sub["url"]).netloc
+        return ["premium session", host] if sub.get("premium", False) else [host]
+
+    slots = asyncio.Semaphore(max_parallel)
+    locks = {key: asyncio.Lock() for s in enabled_subs for key in lock_keys(s)}
+    scraped_keys = set()
+    done = 0
+
+    async def run(sub: Dict) -> None:
+        nonlocal done
+        if sub.get("premium", False) and not credentials_configured:
+            done += 1
             failed.append(sub["name"])
-            print(f"✗ Error scraping {sub['name']}: {e}")
-        
-        # Add delay between substacks (except for the last one)
-        if i < len(enabled_subs):
-            print(f"\nWaiting {delay} seconds before next subscription...")
-            sleep(delay)
+            logger.warning(f"[{done}/{len(enabled_subs)}] ✗ Skipping premium subscription {sub['name']} - credentials not configured\n"
+                           "  Set SUBSTACK_EMAIL and SUBSTACK_PASSWORD in .env file")
+            return
+
+        keys = lock_keys(sub)
+        async with contextlib.AsyncExitStack() as held:
+            for key in keys:
+                await held.enter_async_context(locks[key])
+            # Add delay between subscriptions on the same host or session
+            busy = [key for key in keys if key in scraped_keys]
+            if busy:
+                logger.info(f"Waiting {delay} seconds before next subscription on {busy[0]}...")
+                await asyncio.sleep(delay)
+            scraped_keys.update(keys)
+            async with slots:
+                logger.info(f"\nScraping: {sub['name']}")
+                # The scrapers are blocking, so run them off the event loop
+                name, success, error = await asyncio.to_thread(
+                    _scrape_one, sub, mode, start_date, headless
+                )
+
+        done += 1
+        if success:
+            successful.append(name)
+            logger.info(f"[{done}/{len(enabled_subs)}] ✓ Successfully scraped {name}")
+        elif error:
+            failed.append(name)
+            logger.warning(f"[{done}/{len(enabled_subs)}] ✗ Error scraping {name}: {error}")
+        else:
+            failed.append(name)
+            logger.warning(f"[{done}/{len(enabled_subs)}] ✗ Failed to scrape {name}")
+
+    try:
+        await asyncio.gather(*(run(sub) for sub in enabled_subs))
+    finally:
+        from scrape_manager import close_premium_session
+        close_premium_session()
     
     # Summary
-    print("\n" + "=" * 60)
-    print("Batch Scraping Complete")
-    print("=" * 60)
-    print(f"✓ Successful: {len(successful)} subscriptions")
-    if successful:
-        for name in successful:
-            print(f"  • {name}")
+    summary = ["\n" + "=" * 60, "Batch Scraping Complete", "=" * 60,
+               f"✓ Successful: {len(successful)} subscriptions"]
+    summary += [f"  • {name}" for name in successful]
+    logger.info("\n".join(summary))
     
     if failed:
-        print(f"\n✗ Failed: {len(failed)} subscriptions")
-        for name in failed:
-            print(f"  • {name}")
+        logger.warning("\n".join([f"\n✗ Failed: {len(failed)} subscriptions"] +
+                                  [f"  • {name}" for name in failed]))
+
+
+SETTINGS_KEYS = ['delay_between_substacks', 'default_start_date', 'auto_detect_premium', 'max_parallel']
+
 
+def parse_setting(key: str, value: str):
+    """Parse and validate a setting value. Raises ValueError if invalid."""
+    if key not in SETTINGS_KEYS:
+        raise ValueError(f"Unknown setting '{key}'. Choose from: {', '.join(SETTINGS_KEYS)}")
+
+    if key in ("delay_between_substacks", "max_parallel"):
+        try:
+            number = int(value)
+        except ValueError:
+            raise ValueError(f"Invalid value for {key}: '{value}' is not an integer")
+        # max_parallel sizes the scrape semaphore; 0 would never let a scrape start
+        if key == "max_parallel" and number < 1:
+            raise ValueError(f"Invalid value for {key}: must be at least 1")
+        return number
+    elif key == "auto_detect_premium":
+        return value.lower() in ['true', 'yes', '1']
+    elif key == "default_start_date":
+        # Validate date format
+        if value == "null":
+            return None
+        try:
+            return date.fromisoformat(value).isoformat()
+        except ValueError:
+            raise ValueError("Invalid date format. Use YYYY-MM-DD or 'null'")
+
+
+def update_settings_batch(pairs: List[str]) -> None:
+    """
+    Update one or more settings in the subscriptions file.
+
+    Args:
+        pairs: "key=value" tokens, or a single "key value" pair
+    """
+    # Accept the original two-argument form: set <key> <value>
+    if len(pairs) == 2 and "=" not in pairs[0]:
+        pairs = [f"{pairs[0]}={pairs[1]}"]
+
+    updates = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            print(f"Invalid setting '{pair}'. Use key=value")
+            return
+        try:
+            updates[key] = parse_setting(key, value)
+        except ValueError as e:
+            print(e)
+            return
 
-def update_settings(key: str, value: str) -> None:
-    """Update a setting in the subscriptions file."""
     data = load_subscriptions()
     
     if "settings" not in data:
         data["settings"] = {}
     
-    # Parse value based on key
-    if key == "delay_between_substacks":
-        value = int(value)
-    elif key == "auto_detect_premium":
-        value = value.lower() in ['true', 'yes', '1']
-    elif key == "default_start_date":
-        # Validate date format
-        if value != "null":
-            try:
-                datetime.strptime(value, "%Y-%m-%d")
-            except ValueError:
-                print(f"Invalid date format. Use YYYY-MM-DD or 'null'")
-                return
-        else:
-            value = None
-    
-    data["settings"][key] = value
+    data["settings"].update(updates)
     save_subscriptions(data)
-    print(f"Updated setting: {key} = {value}")
+    for key, value in updates.items():
+        print(f"Updated setting: {key} = {value}")
 
 
 def main():
@@ -307,8 +463,8 @@ Examples:
   python batch_scraper.py toggle https://example.substack.com
   
   # Update settings:
-  python batch_scraper.py set delay_between_substacks 15
-  python batch_scraper.py set default_start_date 2024-01-01
+  python batch_scraper.py set delay_between_substacks=15
+  python batch_scraper.py set default_start_date=2024-01-01 max_parallel=2
         """
     )
     
@@ -317,10 +473,11 @@ Examples:
     # Scrape command
     scrape_parser = subparsers.add_parser('scrape', help='Scrape all enabled subscriptions')
     scrape_parser.add_argument('--initial', action='store_true', help='Perform initial scrape instead of update')
-    scrape_parser.add_argument('--start-date', help='Start date for initial scrape (YYYY-MM-DD)')
+    scrape_parser.add_argument('--start-date', type=iso_date, help='Start date for initial scrape (YYYY-MM-DD)')
     scrape_parser.add_argument('--show-browser', action='store_true', help='Show browser window')
     scrape_parser.add_argument('--dry-run', action='store_true', help='Show what would be scraped without doing it')
     scrape_parser.add_argument('--premium-only', action='store_true', help='Only scrape premium subscriptions')
+    scrape_parser.add_argument('--quiet', action='store_true', help='Only report failures and warnings')
     
     # List command
     list_parser = subparsers.add_parser('list', help='List all subscriptions')
@@ -340,9 +497,9 @@ Examples:
     toggle_parser.add_argument('url', help='Substack URL to toggle')
     
     # Set command
-    set_parser = subparsers.add_parser('set', help='Update a setting')
-    set_parser.add_argument('key', choices=['delay_between_substacks', 'default_start_date', 'auto_detect_premium'])
-    set_parser.add_argument('value', help='New value for the setting')
+    set_parser = subparsers.add_parser('set', help='Update one or more settings')
+    set_parser.add_argument('pairs', nargs='+', metavar='key=value',
+                            help=f"Settings to update ({', '.join(SETTINGS_KEYS)})")
     
     args = parser.parse_args()
     
@@ -352,13 +509,17 @@ Examples:
     
     if args.command == 'scrape':
         mode = 'initial' if args.initial else 'update'
-        scrape_all(
+        if args.quiet:
+            logger.setLevel(logging.WARNING)
+            logging.getLogger("scrape_manager").setLevel(logging.WARNING)
+            logging.getLogger("substack_scraper").setLevel(logging.WARNING)
+        asyncio.run(scrape_all(
             mode=mode,
             start_date=args.start_date,
             headless=not args.show_browser,
             dry_run=args.dry_run,
             premium_only=args.premium_only
-        )
+        ))
     
     elif args.command == 'list':
         list_subscriptions()
@@ -373,7 +534,7 @@ Examples:
         toggle_subscription(args.url)
     
     elif args.command == 'set':
-        update_settings(args.key, args.value)
+        update_settings_batch(args.pairs)
 
 
 if __name__ == "__main__":
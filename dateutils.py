@@ -0,0 +1,23 @@
+"""
+Date helpers shared by the scraper command-line tools.
+Kept free of heavy imports so any entry point can use them at startup.
+"""
+
+import argparse
+from datetime import date
+
+
+def parse_iso_date(value: str) -> str:
+    """Checks a YYYY-MM-DD date and returns it normalized. Raises ValueError naming the bad value."""
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise ValueError(f"invalid date '{value}', use YYYY-MM-DD") from None
+
+
+def iso_date(value: str) -> str:
+    """argparse type for --start-date, reporting a bad date as a usage error."""
+    try:
+        return parse_iso_date(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
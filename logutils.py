@@ -0,0 +1,20 @@
+"""
+Logging setup shared by the scraper modules.
+"""
+
+import logging
+
+
+def make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    """
+    Returns the named logger writing bare messages through a single handler, without
+    propagating to the root logger. A level set before the owning module was imported
+    (e.g. by batch_scraper --quiet ahead of a lazy import) is kept; otherwise it is INFO.
+    """
+    logger = logging.getLogger(name)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
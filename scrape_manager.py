@@ -5,12 +5,19 @@ Provides easy commands for initial scraping and incremental updates.
 """
 
 import argparse
+import functools
+import logging
 import os
 import sys
 from datetime import datetime, timedelta
 from typing import Optional
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import the enhanced scraper
 from substack_scraper_enhanced import (
     SubstackScraper, 
@@ -20,17 +27,65 @@ from substack_scraper_enhanced import (
     JSON_DATA_DIR
 )
 from config import EMAIL, PASSWORD
+from dateutils import iso_date
+from logutils import make_logger
+
+# Per-subscription progress goes through one logger so batch --quiet can silence it
+logger = make_logger("scrape_manager", logging.StreamHandler(sys.stdout))
 
 
+@functools.lru_cache(maxsize=1)
 def get_last_12_months_date() -> str:
-    """Get the date 12 months ago from today."""
+    """Get the date 12 months ago from today (computed once per run)."""
     today = datetime.now()
     twelve_months_ago = today - timedelta(days=365)
     return twelve_months_ago.strftime("%Y-%m-%d")
 
 
+# Logged-in premium scraper kept alive between calls made with reuse_session=True
+_premium_scraper = None
+
+
+def _make_scraper(url: str, premium: bool, headless: bool,
+                  start_date: Optional[str], update_mode: bool,
+                  reuse_session: bool = False):
+    """
+    Construct the free or premium scraper for a Substack URL.
+
+    With reuse_session, a premium scraper (and its browser login) is kept
+    and re-pointed at each new URL instead of being rebuilt.
+    """
+    global _premium_scraper
+    if premium and reuse_session and _premium_scraper is not None:
+        _premium_scraper.set_target(url, start_date, update_mode)
+        return _premium_scraper
+
+    scraper_cls = PremiumSubstackScraper if premium else SubstackScraper
+    kwargs = dict(
+        base_substack_url=url,
+        md_save_dir=BASE_MD_DIR,
+        html_save_dir=BASE_HTML_DIR,
+        start_date=start_date,
+        update_mode=update_mode
+    )
+    if premium:
+        kwargs["headless"] = headless
+    scraper = scraper_cls(**kwargs)
+    if premium and reuse_session:
+        _premium_scraper = scraper
+    return scraper
+
+
+def close_premium_session() -> None:
+    """Close the premium scraper kept by reuse_session (browser and HTTP client), if any."""
+    global _premium_scraper
+    if _premium_scraper is not None:
+        _premium_scraper.close()
+        _premium_scraper = None
+
+
 def initial_scrape(url: str, start_date: Optional[str] = None, premium: bool = True,
-                  num_posts: int = 0, headless: bool = True):
+                  num_posts: int = 0, headless: bool = True, reuse_session: bool = False):
     """
     Perform initial scrape of a Substack for posts from start_date onwards.
     
@@ -40,45 +95,38 @@ def initial_scrape(url: str, start_date: Optional[str] = None, premium: bool = T
         premium: Whether to use premium scraper for paid content
         num_posts: Number of posts to scrape (0 for all)
         headless: Run browser in headless mode for premium scraping
+        reuse_session: Keep the premium browser session for later calls
     """
     if not start_date:
         start_date = get_last_12_months_date()
     
-    print(f"Starting initial scrape of {url}")
-    print(f"Scraping posts from {start_date} onwards")
-    print(f"Mode: {'Premium' if premium else 'Free'} content")
+    # One record per block keeps lines from parallel scrapes together
+    logger.info("\n".join([
+        f"Starting initial scrape of {url}",
+        f"Scraping posts from {start_date} onwards",
+        f"Mode: {'Premium' if premium else 'Free'} content",
+    ]))
     
     if premium:
         if EMAIL == "your-email@domain.com" or PASSWORD == "your-password":
-            print("\nERROR: Please set your Substack credentials in .env file!")
-            print("Copy .env.example to .env and update SUBSTACK_EMAIL and SUBSTACK_PASSWORD")
+            logger.error("\nERROR: Please set your Substack credentials in .env file!\n"
+                         "Copy .env.example to .env and update SUBSTACK_EMAIL and SUBSTACK_PASSWORD")
             return False
-        
-        scraper = PremiumSubstackScraper(
-            base_substack_url=url,
-            md_save_dir=BASE_MD_DIR,
-            html_save_dir=BASE_HTML_DIR,
-            start_date=start_date,
-            update_mode=False,
-            headless=headless,
-            chrome_path='',
-            chrome_driver_path=''
-        )
-    else:
-        scraper = SubstackScraper(
-            base_substack_url=url,
-            md_save_dir=BASE_MD_DIR,
-            html_save_dir=BASE_HTML_DIR,
-            start_date=start_date,
-            update_mode=False
-        )
     
-    scraper.scrape_posts(num_posts)
-    print(f"\nInitial scrape complete!")
+    scraper = _make_scraper(url, premium, headless, start_date, update_mode=False,
+                            reuse_session=reuse_session)
+    try:
+        scraper.scrape_posts(num_posts)
+    finally:
+        # A reused premium scraper stays open until close_premium_session()
+        if not (premium and reuse_session):
+            scraper.close()
+    logger.info(f"\nInitial scrape of {url} complete!")
     return True
 
 
-def update_scrape(url: str, premium: bool = True, headless: bool = True):
+def update_scrape(url: str, premium: bool = True, headless: bool = True,
+                  reuse_session: bool = False):
     """
     Perform incremental update, only scraping new posts not already downloaded.
     
@@ -86,38 +134,30 @@ def update_scrape(url: str, premium: bool = True, headless: bool = True):
         url: The Substack URL to scrape
         premium: Whether to use premium scraper for paid content
         headless: Run browser in headless mode for premium scraping
+        reuse_session: Keep the premium browser session for later calls
     """
-    print(f"Starting update scrape of {url}")
-    print(f"Mode: {'Premium' if premium else 'Free'} content")
-    print("Only new posts will be downloaded")
+    # One record per block keeps lines from parallel scrapes together
+    logger.info("\n".join([
+        f"Starting update scrape of {url}",
+        f"Mode: {'Premium' if premium else 'Free'} content",
+        "Only new posts will be downloaded",
+    ]))
     
     if premium:
         if EMAIL == "your-email@domain.com" or PASSWORD == "your-password":
-            print("\nERROR: Please set your Substack credentials in .env file!")
-            print("Copy .env.example to .env and update SUBSTACK_EMAIL and SUBSTACK_PASSWORD")
+            logger.error("\nERROR: Please set your Substack credentials in .env file!\n"
+                         "Copy .env.example to .env and update SUBSTACK_EMAIL and SUBSTACK_PASSWORD")
             return False
-        
-        scraper = PremiumSubstackScraper(
-            base_substack_url=url,
-            md_save_dir=BASE_MD_DIR,
-            html_save_dir=BASE_HTML_DIR,
-            start_date=None,
-            update_mode=True,
-            headless=headless,
-            chrome_path='',
-            chrome_driver_path=''
-        )
-    else:
-        scraper = SubstackScraper(
-            base_substack_url=url,
-            md_save_dir=BASE_MD_DIR,
-            html_save_dir=BASE_HTML_DIR,
-            start_date=None,
-            update_mode=True
-        )
     
-    scraper.scrape_posts(0)  # Scrape all new posts
-    print(f"\nUpdate scrape complete!")
+    scraper = _make_scraper(url, premium, headless, start_date=None, update_mode=True,
+                            reuse_session=reuse_session)
+    try:
+        scraper.scrape_posts(0)  # Scrape all new posts
+    finally:
+        # A reused premium scraper stays open until close_premium_session()
+        if not (premium and reuse_session):
+            scraper.close()
+    logger.info(f"\nUpdate scrape of {url} complete!")
     return True
 
 
@@ -127,8 +167,8 @@ def list_scraped_substacks():
         print("No Substacks have been scraped yet.")
         return
     
-    substacks = [d for d in os.listdir(BASE_MD_DIR) 
-                 if os.path.isdir(os.path.join(BASE_MD_DIR, d))]
+    with os.scandir(BASE_MD_DIR) as it:
+        substacks = [e for e in it if e.is_dir(follow_symlinks=False)]
     
     if not substacks:
         print("No Substacks have been scraped yet.")
@@ -137,17 +177,18 @@ def list_scraped_substacks():
     print("\nScraped Substacks:")
     print("-" * 50)
     
-    for substack in substacks:
-        md_dir = os.path.join(BASE_MD_DIR, substack)
-        post_count = len([f for f in os.listdir(md_dir) if f.endswith('.md')])
+    for entry in substacks:
+        substack = entry.name
+        with os.scandir(entry.path) as it:
+            post_count = sum(1 for f in it if f.name.endswith('.md') and f.is_file(follow_symlinks=False))
         
         # Try to get last update time from metadata
         metadata_file = os.path.join(JSON_DATA_DIR, f'{substack}_metadata.json')
         last_update = "Unknown"
         if os.path.exists(metadata_file):
             try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    metadata = orjson.loads(f.read()) if orjson else json.load(f)
                     if 'last_update' in metadata:
                         last_update = metadata['last_update'][:10]  # Just the date part
             except:
@@ -184,7 +225,7 @@ Examples:
     # Initial scrape command
     initial_parser = subparsers.add_parser('initial', help='Perform initial scrape')
     initial_parser.add_argument('url', help='Substack URL to scrape')
-    initial_parser.add_argument('--start-date', help='Start date (YYYY-MM-DD), default: 12 months ago')
+    initial_parser.add_argument('--start-date', type=iso_date, help='Start date (YYYY-MM-DD), default: 12 months ago')
     initial_parser.add_argument('--free', action='store_true', help='Only scrape free content')
     initial_parser.add_argument('--num-posts', type=int, default=0, help='Number of posts to scrape (0 for all)')
     initial_parser.add_argument('--show-browser', action='store_true', help='Show browser window (for debugging)')
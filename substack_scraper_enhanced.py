@@ -1,27 +1,36 @@
 import argparse
+import functools
+import html
 import json
+import logging
 import os
 import pickle
 import random
+import re
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import closing
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple, Dict
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from time import sleep
 from urllib.parse import urlparse, parse_qs
 
-from bs4 import BeautifulSoup
 import html2text
-import markdown
-import requests
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from tqdm import tqdm
 from xml.etree import ElementTree as ET
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from config import EMAIL, PASSWORD
+from dateutils import iso_date, parse_iso_date
+from logutils import make_logger
 
 USE_PREMIUM: bool = True
 BASE_SUBSTACK_URL: str = "https://www.thefitzwilliam.com/"
@@ -36,6 +45,11 @@ UPDATE_MODE: bool = False  # If True, only scrape new articles not already downl
 # Polite scraping settings
 MIN_DELAY: float = 2.0  # Minimum delay between requests (seconds)
 MAX_DELAY: float = 5.0  # Maximum delay between requests (seconds)
+MAX_WORKERS: int = 4  # Concurrent article fetches for the free scraper (each waits its own delay)
+MAX_RETRIES: int = 3  # Retries for rate-limited or gateway-error responses
+RETRY_STATUSES = (429, 502, 503, 504)
+# Matches the paywall heading in raw page bytes, so paywalled posts can be skipped before parsing
+PAYWALL_RE = re.compile(rb'<h2[^>]*\bclass="[^"]*\bpaywall-title\b')
 USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -44,32 +58,105 @@ USER_AGENTS = [
 ]
 
 
+class TqdmLoggingHandler(logging.Handler):
+    """Writes log records through tqdm.write so they don't break up the progress bar."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            tqdm.write(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+# Scraper output goes through one logger so worker threads share a single handler
+logger = make_logger("substack_scraper", TqdmLoggingHandler())
+
+
+def load_json(path: str):
+    """Reads a JSON file, using orjson when it is installed."""
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dumps_json(data, pretty: bool = True) -> str:
+    """Serializes data to a JSON string (2-space indented unless pretty is False)."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, option=option).decode()
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def iter_xml_elements(chunks: Iterable[bytes], tag: str) -> Iterator[ET.Element]:
+    """
+    Incrementally parses XML from byte chunks, yielding each `tag` element as it closes.
+    Yielded elements are then detached from their parent, so memory stays flat on large files.
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    # Open ancestors of the element being parsed, to find each yielded element's parent
+    stack: List[ET.Element] = []
+
+    def drain() -> Iterator[ET.Element]:
+        for event, elem in parser.read_events():
+            if event == 'start':
+                stack.append(elem)
+                continue
+            stack.pop()
+            if elem.tag == tag:
+                yield elem
+                if stack:
+                    stack[-1].remove(elem)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
+
+
 def extract_main_part(url: str) -> str:
     parts = urlparse(url).netloc.split('.')
     return parts[1] if parts[0] == 'www' else parts[0]
 
 
-def generate_html_file(author_name: str) -> None:
+AUTHOR_NAME_MARKER: str = '<!-- AUTHOR_NAME -->'
+ESSAYS_DATA_MARKER: str = '<script type="application/json" id="essaysData"></script>'
+
+
+@functools.lru_cache(maxsize=1)
+def load_html_template() -> Tuple[str, ...]:
     """
-    Generates a HTML file for the given author.
+    Reads the author page template once and splits it around its markers,
+    so each page is rendered with a single join.
+    """
+    with open(HTML_TEMPLATE, 'r', encoding='utf-8') as file:
+        html_template = file.read()
+    markers = f"({re.escape(AUTHOR_NAME_MARKER)}|{re.escape(ESSAYS_DATA_MARKER)})"
+    return tuple(re.split(markers, html_template))
+
+
+def generate_html_file(author_name: str, essays_data: Optional[List[Dict]] = None) -> None:
+    """
+    Generates a HTML file for the given author. Essays are read from the
+    author's JSON file unless already supplied.
     """
     if not os.path.exists(BASE_HTML_DIR):
         os.makedirs(BASE_HTML_DIR)
 
-    json_path = os.path.join(JSON_DATA_DIR, f'{author_name}.json')
-    with open(json_path, 'r', encoding='utf-8') as file:
-        essays_data = json.load(file)
-
-    embedded_json_data = json.dumps(essays_data, ensure_ascii=False, indent=4)
+    if essays_data is None:
+        json_path = os.path.join(JSON_DATA_DIR, f'{author_name}.json')
+        essays_data = load_json(json_path)
 
-    with open(HTML_TEMPLATE, 'r', encoding='utf-8') as file:
-        html_template = file.read()
-
-    html_with_data = html_template.replace('<!-- AUTHOR_NAME -->', author_name).replace(
-        '<script type="application/json" id="essaysData"></script>',
-        f'<script type="application/json" id="essaysData">{embedded_json_data}</script>'
-    )
-    html_with_author = html_with_data.replace('author_name', author_name)
+    embedded_json_data = dumps_json(essays_data)
+    replacements = {
+        AUTHOR_NAME_MARKER: author_name,
+        ESSAYS_DATA_MARKER: f'<script type="application/json" id="essaysData">{embedded_json_data}</script>',
+    }
+    html_with_author = "".join(replacements.get(part, part) for part in load_html_template())
 
     html_output_path = os.path.join(BASE_HTML_DIR, f'{author_name}.html')
     with open(html_output_path, 'w', encoding='utf-8') as file:
@@ -77,30 +164,61 @@ def generate_html_file(author_name: str) -> None:
 
 
 class BaseSubstackScraper(ABC):
+    # Number of posts fetched concurrently by scrape_posts
+    max_workers: int = 1
+
     def __init__(self, base_substack_url: str, md_save_dir: str, html_save_dir: str, 
                  start_date: Optional[str] = None, update_mode: bool = False):
+        self.md_base_dir: str = md_save_dir
+        self.html_base_dir: str = html_save_dir
+        self.keywords: List[str] = ["about", "archive", "podcast"]
+        self._keyword_re = re.compile('|'.join(re.escape(keyword) for keyword in self.keywords))
+        self._lock = threading.Lock()
+
+        # One HTTP/2 connection to the Substack host carries all requests as multiplexed streams
+        limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+        self.client = httpx.Client(
+            transport=httpx.HTTPTransport(http2=True, limits=limits, retries=MAX_RETRIES),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            # Match requests, which followed redirects (e.g. a moved sitemap or post URL)
+            follow_redirects=True,
+            headers={
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate',
+                'Upgrade-Insecure-Requests': '1'
+            }
+        )
+        self.set_target(base_substack_url, start_date, update_mode)
+
+    def set_target(self, base_substack_url: str, start_date: Optional[str] = None,
+                   update_mode: bool = False) -> None:
+        """
+        Points the scraper at a Substack site, loading its post URLs and metadata.
+        Lets one logged-in scraper be reused across several sites.
+        """
         if not base_substack_url.endswith("/"):
             base_substack_url += "/"
         self.base_substack_url: str = base_substack_url
-        self.start_date = start_date
+        # Checked here so a bad date from settings or callers fails clearly, not in the date filters
+        self.start_date = parse_iso_date(start_date) if start_date else None
         self.update_mode = update_mode
 
         self.writer_name: str = extract_main_part(base_substack_url)
-        md_save_dir: str = f"{md_save_dir}/{self.writer_name}"
+        md_save_dir: str = f"{self.md_base_dir}/{self.writer_name}"
 
         self.md_save_dir: str = md_save_dir
-        self.html_save_dir: str = f"{html_save_dir}/{self.writer_name}"
+        self.html_save_dir: str = f"{self.html_base_dir}/{self.writer_name}"
 
         if not os.path.exists(md_save_dir):
             os.makedirs(md_save_dir)
-            print(f"Created md directory {md_save_dir}")
+            logger.info(f"Created md directory {md_save_dir}")
         if not os.path.exists(self.html_save_dir):
             os.makedirs(self.html_save_dir)
-            print(f"Created html directory {self.html_save_dir}")
+            logger.info(f"Created html directory {self.html_save_dir}")
 
-        self.keywords: List[str] = ["about", "archive", "podcast"]
-        self.existing_files = self.get_existing_files() if update_mode else set()
-        self.post_urls: List[str] = self.get_all_post_urls()
+        self.existing_files = self.get_existing_files() if update_mode else frozenset()
+        self.post_urls: List[Tuple[str, str]] = self.get_all_post_urls()
         
         # Track scraped articles metadata
         self.metadata_file = os.path.join(JSON_DATA_DIR, f'{self.writer_name}_metadata.json')
@@ -109,8 +227,7 @@ class BaseSubstackScraper(ABC):
     def load_metadata(self) -> Dict:
         """Load metadata about previously scraped articles."""
         if os.path.exists(self.metadata_file):
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json(self.metadata_file)
         return {"articles": {}, "last_update": None}
     
     def save_metadata(self) -> None:
@@ -118,18 +235,18 @@ class BaseSubstackScraper(ABC):
         self.metadata["last_update"] = datetime.now().isoformat()
         os.makedirs(JSON_DATA_DIR, exist_ok=True)
         with open(self.metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(self.metadata, f, ensure_ascii=False, indent=2)
-
-    def get_existing_files(self) -> set:
-        """Get set of already downloaded post URLs based on existing files."""
-        existing = set()
-        if os.path.exists(self.md_save_dir):
-            for filename in os.listdir(self.md_save_dir):
-                if filename.endswith('.md'):
-                    # Convert filename back to URL pattern
-                    post_slug = filename[:-3]  # Remove .md extension
-                    existing.add(post_slug)
-        return existing
+            f.write(dumps_json(self.metadata))
+
+    def get_existing_files(self) -> frozenset:
+        """Get set of already downloaded post slugs based on existing files."""
+        if not os.path.exists(self.md_save_dir):
+            return frozenset()
+        with os.scandir(self.md_save_dir) as it:
+            # Convert filename back to URL pattern by removing the .md extension
+            return frozenset(
+                entry.name[:-3] for entry in it
+                if entry.name.endswith('.md') and entry.is_file(follow_symlinks=False)
+            )
 
     def polite_delay(self) -> None:
         """Add a random delay between requests to be polite to the server."""
@@ -140,106 +257,128 @@ class BaseSubstackScraper(ABC):
         """Get a random user agent for requests."""
         return random.choice(USER_AGENTS)
 
-    def get_all_post_urls(self) -> List[str]:
+    def fetch(self, url: str, stream: bool = False) -> httpx.Response:
+        """
+        GETs a URL through the shared client with a random user agent, backing off
+        and retrying on rate-limit and gateway errors. Streamed responses must be closed.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            request = self.client.build_request("GET", url, headers={'User-Agent': self.get_random_user_agent()})
+            try:
+                response = self.client.send(request, stream=stream)
+            except httpx.TimeoutException:
+                # The transport's own retries only cover connection failures
+                if attempt == MAX_RETRIES:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    return response
+                response.close()
+            sleep(0.5 * 2 ** attempt)
+
+    def close(self) -> None:
+        """Closes the HTTP client and its connection pool."""
+        self.client.close()
+
+    def get_all_post_urls(self) -> List[Tuple[str, str]]:
         """
         Attempts to fetch URLs from sitemap.xml, falling back to feed.xml if necessary.
         Filters by date if start_date is provided.
+        Returns (url, slug) pairs so each post's slug is computed only once.
         """
         urls = self.fetch_urls_from_sitemap()
         if not urls:
             urls = self.fetch_urls_from_feed()
         
-        filtered_urls = self.filter_urls(urls, self.keywords)
+        post_urls = [(url, self.get_slug_from_url(url)) for url in self.filter_urls(urls)]
         
         # Filter by existing files if in update mode
         if self.update_mode and self.existing_files:
-            new_urls = []
-            for url in filtered_urls:
-                post_slug = url.split("/")[-1]
-                if post_slug not in self.existing_files:
-                    new_urls.append(url)
-            print(f"Found {len(new_urls)} new articles to scrape (out of {len(filtered_urls)} total)")
-            filtered_urls = new_urls
+            new_urls = [(url, slug) for url, slug in post_urls if slug not in self.existing_files]
+            logger.info(f"Found {len(new_urls)} new articles to scrape (out of {len(post_urls)} total)")
+            post_urls = new_urls
         
-        return filtered_urls
+        return post_urls
+
+    def get_start_datetime(self) -> Optional[datetime]:
+        """
+        Parses start_date once for the date filters, as a naive datetime.
+        """
+        if not self.start_date:
+            return None
+        return datetime.fromisoformat(self.start_date).replace(tzinfo=None)
 
     def fetch_urls_from_sitemap(self) -> List[str]:
         """
-        Fetches URLs from sitemap.xml.
+        Fetches URLs from sitemap.xml, parsing the response as it streams in.
         """
         sitemap_url = f"{self.base_substack_url}sitemap.xml"
-        headers = {'User-Agent': self.get_random_user_agent()}
-        response = requests.get(sitemap_url, headers=headers)
-
-        if not response.ok:
-            print(f'Error fetching sitemap at {sitemap_url}: {response.status_code}')
-            return []
-
-        root = ET.fromstring(response.content)
         urls = []
-        namespace = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-        
-        for url_elem in root.findall('.//ns:url', namespace):
-            loc = url_elem.find('ns:loc', namespace)
-            lastmod = url_elem.find('ns:lastmod', namespace)
-            
-            if loc is not None and loc.text:
-                # Check date filter if provided
-                if self.start_date and lastmod is not None and lastmod.text:
-                    try:
-                        post_date = datetime.fromisoformat(lastmod.text.replace('Z', '+00:00'))
-                        start_datetime = datetime.fromisoformat(self.start_date)
-                        if post_date < start_datetime:
-                            continue
-                    except:
-                        pass  # If date parsing fails, include the URL
-                
-                urls.append(loc.text)
-        
+        namespace = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+        start_datetime = self.get_start_datetime()
+
+        with closing(self.fetch(sitemap_url, stream=True)) as response:
+            if response.is_error:
+                logger.warning(f'Error fetching sitemap at {sitemap_url}: {response.status_code}')
+                return []
+
+            for url_elem in iter_xml_elements(response.iter_bytes(), f'{namespace}url'):
+                loc = url_elem.findtext(f'{namespace}loc')
+                lastmod = url_elem.findtext(f'{namespace}lastmod')
+
+                if loc:
+                    # Check date filter if provided
+                    if start_datetime and lastmod:
+                        try:
+                            post_date = datetime.fromisoformat(lastmod.replace('Z', '+00:00'))
+                            if post_date.replace(tzinfo=None) < start_datetime:
+                                continue
+                        except ValueError:
+                            pass  # If date parsing fails, include the URL
+
+                    urls.append(loc)
+
         return urls
 
     def fetch_urls_from_feed(self) -> List[str]:
         """
         Fetches URLs from feed.xml with date filtering.
         """
-        print('Falling back to feed.xml. This will only contain up to the 22 most recent posts.')
+        logger.info('Falling back to feed.xml. This will only contain up to the 22 most recent posts.')
         feed_url = f"{self.base_substack_url}feed.xml"
-        headers = {'User-Agent': self.get_random_user_agent()}
-        response = requests.get(feed_url, headers=headers)
+        urls = []
+        start_datetime = self.get_start_datetime()
 
-        if not response.ok:
-            print(f'Error fetching feed at {feed_url}: {response.status_code}')
-            return []
+        with closing(self.fetch(feed_url, stream=True)) as response:
+            if response.is_error:
+                logger.warning(f'Error fetching feed at {feed_url}: {response.status_code}')
+                return []
 
-        root = ET.fromstring(response.content)
-        urls = []
-        
-        for item in root.findall('.//item'):
-            link = item.find('link')
-            pubdate = item.find('pubDate')
-            
-            if link is not None and link.text:
-                # Check date filter if provided
-                if self.start_date and pubdate is not None and pubdate.text:
-                    try:
-                        from email.utils import parsedate_to_datetime
-                        post_date = parsedate_to_datetime(pubdate.text)
-                        start_datetime = datetime.fromisoformat(self.start_date)
-                        if post_date.replace(tzinfo=None) < start_datetime:
-                            continue
-                    except:
-                        pass  # If date parsing fails, include the URL
-                
-                urls.append(link.text)
+            for item in iter_xml_elements(response.iter_bytes(), 'item'):
+                link = item.findtext('link')
+                pubdate = item.findtext('pubDate')
+
+                if link:
+                    # Check date filter if provided
+                    if start_datetime and pubdate:
+                        try:
+                            post_date = parsedate_to_datetime(pubdate)
+                            if post_date.replace(tzinfo=None) < start_datetime:
+                                continue
+                        except (ValueError, TypeError):
+                            pass  # If date parsing fails, include the URL
+
+                    urls.append(link)
 
         return urls
 
-    @staticmethod
-    def filter_urls(urls: List[str], keywords: List[str]) -> List[str]:
+    def filter_urls(self, urls: List[str]) -> List[str]:
         """
-        This method filters out URLs that contain certain keywords
+        This method filters out URLs that contain any of the scraper's keywords
         """
-        return [url for url in urls if all(keyword not in url for keyword in keywords)]
+        if not self.keywords:
+            return list(urls)
+        return [url for url in urls if not self._keyword_re.search(url)]
 
     @staticmethod
     def html_to_md(html_content: str) -> str:
@@ -248,6 +387,8 @@ class BaseSubstackScraper(ABC):
         """
         if not isinstance(html_content, str):
             raise ValueError("html_content must be a string")
+        # HTML2Text carries parser state (start-of-document flag, link and list
+        # counters) over between handle() calls, so a fresh converter is needed per post
         h = html2text.HTML2Text()
         h.ignore_links = False
         h.body_width = 0
@@ -264,23 +405,17 @@ class BaseSubstackScraper(ABC):
         if not isinstance(content, str):
             raise ValueError("content must be a string")
 
-        if os.path.exists(filepath):
-            print(f"File already exists: {filepath}")
-            return
-
-        with open(filepath, 'w', encoding='utf-8') as file:
-            file.write(content)
-
-    @staticmethod
-    def md_to_html(md_content: str) -> str:
-        """
-        This method converts Markdown to HTML
-        """
-        return markdown.markdown(md_content, extensions=['extra'])
+        # Exclusive create: fails atomically if the file already exists
+        try:
+            with open(filepath, 'x', encoding='utf-8') as file:
+                file.write(content)
+        except FileExistsError:
+            logger.info(f"File already exists: {filepath}")
 
     def save_to_html_file(self, filepath: str, content: str) -> None:
         """
         This method saves HTML content to a file with a link to an external CSS file.
+        Existing files are left untouched, as in save_to_file.
         """
         if not isinstance(filepath, str):
             raise ValueError("filepath must be a string")
@@ -309,13 +444,26 @@ class BaseSubstackScraper(ABC):
             </html>
         """
 
-        with open(filepath, 'w', encoding='utf-8') as file:
-            file.write(html_content)
+        try:
+            with open(filepath, 'x', encoding='utf-8') as file:
+                file.write(html_content)
+        except FileExistsError:
+            logger.info(f"File already exists: {filepath}")
 
     @staticmethod
-    def get_filename_from_url(url: str, filetype: str = ".md") -> str:
+    def get_slug_from_url(url: str) -> str:
         """
-        Gets the filename from the URL (the ending)
+        Gets the post slug from the URL (the last path segment)
+        """
+        if not isinstance(url, str):
+            raise ValueError("url must be a string")
+
+        return url.rstrip("/").split("/")[-1]
+
+    @staticmethod
+    def get_filename_from_url(url: str, filetype: str = ".md", slug: Optional[str] = None) -> str:
+        """
+        Gets the filename from the URL (the ending), or from an already computed slug
         """
         if not isinstance(url, str):
             raise ValueError("url must be a string")
@@ -326,7 +474,9 @@ class BaseSubstackScraper(ABC):
         if not filetype.startswith("."):
             filetype = f".{filetype}"
 
-        return url.split("/")[-1] + filetype
+        if slug is None:
+            slug = BaseSubstackScraper.get_slug_from_url(url)
+        return slug + filetype
 
     @staticmethod
     def combine_metadata_and_content(title: str, subtitle: str, date: str, like_count: str, content) -> str:
@@ -347,50 +497,67 @@ class BaseSubstackScraper(ABC):
 
         return metadata + content
 
-    def extract_post_data(self, soup: BeautifulSoup, url: str) -> Tuple[str, str, str, str, str]:
+    @staticmethod
+    def combine_metadata_and_html(title: str, subtitle: str, date: str, like_count: str, content: str) -> str:
         """
-        Converts substack post soup to markdown, returns metadata and content
+        Combines the title, subtitle, and post HTML into a single HTML fragment
         """
-        title = soup.select_one("h1.post-title, h2").text.strip()
+        if not isinstance(title, str):
+            raise ValueError("title must be a string")
 
-        subtitle_element = soup.select_one("h3.subtitle")
-        subtitle = subtitle_element.text.strip() if subtitle_element else ""
+        if not isinstance(content, str):
+            raise ValueError("content must be a string")
 
-        date_element = soup.find(
-            "div",
-            class_="pencraft pc-reset color-pub-secondary-text-hGQ02T line-height-20-t4M0El font-meta-MWBumP size-11-NuY2Zx weight-medium-fw81nC transform-uppercase-yKDgcq reset-IxiVJZ meta-EgzBVA"
-        )
-        date = date_element.text.strip() if date_element else "Date not found"
+        metadata = f"<h1>{html.escape(title)}</h1>\n"
+        if subtitle:
+            metadata += f"<h2>{html.escape(subtitle)}</h2>\n"
+        metadata += f"<p><strong>{html.escape(date)}</strong></p>\n"
+        metadata += f"<p><strong>Likes:</strong> {html.escape(like_count)}</p>\n"
+
+        return metadata + content
+
+    def extract_post_data(self, tree: LexborHTMLParser, url: str, post_slug: str) -> Tuple[str, str, str, str, str, str]:
+        """
+        Converts substack post tree to markdown, returns metadata, markdown and the post's raw HTML
+        """
+        title = tree.css_first("h1.post-title, h2").text().strip()
+
+        subtitle_element = tree.css_first("h3.subtitle")
+        subtitle = subtitle_element.text().strip() if subtitle_element else ""
 
-        like_count_element = soup.select_one("a.post-ufi-button .label")
+        date_element = tree.css_first('div.color-pub-secondary-text-hGQ02T')
+        date = date_element.text().strip() if date_element else "Date not found"
+
+        like_count_element = tree.css_first("a.post-ufi-button .label")
         like_count = (
-            like_count_element.text.strip()
-            if like_count_element and like_count_element.text.strip().isdigit()
+            like_count_element.text().strip()
+            if like_count_element and like_count_element.text().strip().isdigit()
             else "0"
         )
 
-        content = str(soup.select_one("div.available-content"))
+        content_element = tree.css_first("div.available-content")
+        content = content_element.html if content_element else ""
         md = self.html_to_md(content)
         md_content = self.combine_metadata_and_content(title, subtitle, date, like_count, md)
         
         # Store metadata
-        post_slug = url.split("/")[-1]
-        self.metadata["articles"][post_slug] = {
-            "url": url,
-            "title": title,
-            "date": date,
-            "scraped_at": datetime.now().isoformat()
-        }
+        with self._lock:
+            self.metadata["articles"][post_slug] = {
+                "url": url,
+                "title": title,
+                "date": date,
+                "scraped_at": datetime.now().isoformat()
+            }
         
-        return title, subtitle, like_count, date, md_content
+        return title, subtitle, like_count, date, md_content, content
 
     @abstractmethod
-    def get_url_soup(self, url: str) -> str:
+    def get_url_tree(self, url: str) -> Optional[LexborHTMLParser]:
         raise NotImplementedError
 
-    def save_essays_data_to_json(self, essays_data: list) -> None:
+    def save_essays_data_to_json(self, essays_data: list) -> List[Dict]:
         """
-        Saves essays data to a JSON file for a specific author.
+        Saves essays data to a JSON file for a specific author, returning the merged list.
         """
         data_dir = os.path.join(JSON_DATA_DIR)
         if not os.path.exists(data_dir):
@@ -398,96 +565,142 @@ class BaseSubstackScraper(ABC):
 
         json_path = os.path.join(data_dir, f'{self.writer_name}.json')
         if os.path.exists(json_path):
-            with open(json_path, 'r', encoding='utf-8') as file:
-                existing_data = json.load(file)
-            essays_data = existing_data + [data for data in essays_data if data not in existing_data]
+            existing_data = load_json(json_path)
+            # Essays are identified by their markdown file
+            existing_links = {data['file_link'] for data in existing_data}
+            essays_data = existing_data + [data for data in essays_data if data['file_link'] not in existing_links]
+        # Compact output: this file is only read back by the scraper, which
+        # pretty-prints the data when embedding it in the author page
         with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(essays_data, f, ensure_ascii=False, indent=4)
+            f.write(dumps_json(essays_data, pretty=False))
+        return essays_data
+
+    def _fetch_and_parse(self, url: str, slug: str, md_filepath: str, html_filepath: str) -> Optional[Dict]:
+        """
+        Fetches a single post, saves it as markdown and html, and returns its essay data
+        """
+        try:
+            # Add polite delay before each request
+            self.polite_delay()
+
+            tree = self.get_url_tree(url)
+            if tree is None:
+                return None
+            title, subtitle, like_count, date, md, content = self.extract_post_data(tree, url, slug)
+            self.save_to_file(md_filepath, md)
+
+            # Save the post's own HTML rather than re-rendering the markdown
+            html_content = self.combine_metadata_and_html(title, subtitle, date, like_count, content)
+            self.save_to_html_file(html_filepath, html_content)
+
+            return {
+                "title": title,
+                "subtitle": subtitle,
+                "like_count": like_count,
+                "date": date,
+                "file_link": md_filepath,
+                "html_link": html_filepath
+            }
+        except Exception as e:
+            # Tracebacks only when debugging, so one bad post doesn't flood the bar
+            logger.warning(f"Error scraping post {url}: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
+            return None
 
     def scrape_posts(self, num_posts_to_scrape: int = 0) -> None:
         """
         Iterates over all posts and saves them as markdown and html files
         """
-        essays_data = []
-        count = 0
-        total = num_posts_to_scrape if num_posts_to_scrape != 0 else len(self.post_urls)
-        
         if len(self.post_urls) == 0:
-            print("No new posts to scrape.")
+            logger.info("No new posts to scrape.")
             return
-        
-        print(f"Starting to scrape {total} posts...")
-        
-        for url in tqdm(self.post_urls, total=total):
-            try:
-                md_filename = self.get_filename_from_url(url, filetype=".md")
-                html_filename = self.get_filename_from_url(url, filetype=".html")
-                md_filepath = os.path.join(self.md_save_dir, md_filename)
-                html_filepath = os.path.join(self.html_save_dir, html_filename)
-
-                if not os.path.exists(md_filepath):
-                    # Add polite delay before each request
-                    self.polite_delay()
-                    
-                    soup = self.get_url_soup(url)
-                    if soup is None:
-                        total += 1
-                        continue
-                    title, subtitle, like_count, date, md = self.extract_post_data(soup, url)
-                    self.save_to_file(md_filepath, md)
-
-                    # Convert markdown to HTML and save
-                    html_content = self.md_to_html(md)
-                    self.save_to_html_file(html_filepath, html_content)
-
-                    essays_data.append({
-                        "title": title,
-                        "subtitle": subtitle,
-                        "like_count": like_count,
-                        "date": date,
-                        "file_link": md_filepath,
-                        "html_link": html_filepath
-                    })
-                else:
-                    print(f"File already exists: {md_filepath}")
-            except Exception as e:
-                print(f"Error scraping post {url}: {e}")
-            count += 1
-            if num_posts_to_scrape != 0 and count == num_posts_to_scrape:
-                break
-        
-        self.save_essays_data_to_json(essays_data=essays_data)
-        self.save_metadata()
-        generate_html_file(author_name=self.writer_name)
-        print(f"Scraping complete. Scraped {len(essays_data)} new posts.")
+
+        tasks = []
+        for url, slug in self.post_urls:
+            md_filepath = os.path.join(self.md_save_dir, self.get_filename_from_url(url, ".md", slug))
+            html_filepath = os.path.join(self.html_save_dir, self.get_filename_from_url(url, ".html", slug))
+            if os.path.exists(md_filepath):
+                logger.info(f"File already exists: {md_filepath}")
+            else:
+                tasks.append((url, slug, md_filepath, html_filepath))
+
+        # num_posts_to_scrape counts saved posts: paywalled or failed ones don't use up the limit
+        limit = num_posts_to_scrape
+        total = min(limit, len(tasks)) if limit else len(tasks)
+        logger.info(f"Starting to scrape {total} posts...")
+
+        # Results are stored by task index so essays keep the sitemap order
+        results: List[Optional[Dict]] = [None] * len(tasks)
+        futures = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                next_task = 0
+                in_flight = set()
+                saved = 0
+                # The bar follows the logger, so quiet runs stay quiet
+                progress = tqdm(total=total, disable=not logger.isEnabledFor(logging.INFO))
+                try:
+                    while True:
+                        # Tasks are submitted as workers free up, so a limited run stops
+                        # once enough posts are saved and can top up after skipped ones
+                        while (next_task < len(tasks) and len(in_flight) < self.max_workers
+                               and (not limit or saved + len(in_flight) < limit)):
+                            future = executor.submit(self._fetch_and_parse, *tasks[next_task])
+                            futures[future] = next_task
+                            in_flight.add(future)
+                            next_task += 1
+                        if not in_flight:
+                            break
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            results[futures[future]] = future.result()
+                            if results[futures[future]] is not None:
+                                saved += 1
+                            if results[futures[future]] is not None or not limit:
+                                progress.update(1)
+                except BaseException:
+                    # Don't start anything new on Ctrl-C or error; leaving the block
+                    # then only waits for the posts already in flight
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                finally:
+                    progress.close()
+        finally:
+            # Record every post that finished, even on an interrupted run, since its
+            # files are on disk and later update runs will skip it
+            for future, i in futures.items():
+                if results[i] is None and future.done() and not future.cancelled() and future.exception() is None:
+                    results[i] = future.result()
+            essays_data = [essay for essay in results if essay is not None]
+
+            # Only rewrite the essays file and author page when something new was scraped
+            if essays_data:
+                all_essays = self.save_essays_data_to_json(essays_data=essays_data)
+                generate_html_file(author_name=self.writer_name, essays_data=all_essays)
+            self.save_metadata()
+        logger.info(f"Scraping complete. Scraped {len(essays_data)} new posts.")
 
 
 class SubstackScraper(BaseSubstackScraper):
+    # Plain HTTP fetches are safe to run in parallel; the premium scraper's
+    # Selenium driver is not, so it keeps the default of one worker
+    max_workers: int = MAX_WORKERS
+
     def __init__(self, base_substack_url: str, md_save_dir: str, html_save_dir: str,
                  start_date: Optional[str] = None, update_mode: bool = False):
         super().__init__(base_substack_url, md_save_dir, html_save_dir, start_date, update_mode)
 
-    def get_url_soup(self, url: str) -> Optional[BeautifulSoup]:
+    def get_url_tree(self, url: str) -> Optional[LexborHTMLParser]:
         """
-        Gets soup from URL using requests with polite headers
+        Gets parsed HTML tree from URL using the shared HTTP/2 client with polite headers
         """
         try:
-            headers = {
-                'User-Agent': self.get_random_user_agent(),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-            page = requests.get(url, headers=headers)
-            soup = BeautifulSoup(page.content, "html.parser")
-            if soup.find("h2", class_="paywall-title"):
-                print(f"Skipping premium article: {url}")
+            page = self.fetch(url)
+            if PAYWALL_RE.search(page.content):
+                logger.info(f"Skipping premium article: {url}")
                 return None
-            return soup
+            return LexborHTMLParser(page.content)
         except Exception as e:
-            print(f"Error fetching page {url}: {e}")
+            logger.warning(f"Error fetching page {url}: {e}")
             return None
 
 
@@ -507,12 +720,20 @@ class PremiumSubstackScraper(BaseSubstackScraper):
             cookies_file: str = 'substack_cookies.pkl',
             user_data_dir: str = None
     ) -> None:
+        # Selenium is imported here rather than at module level so the
+        # non-premium path never pays for loading it
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+        from selenium.webdriver.chrome.service import Service
+
         super().__init__(base_substack_url, md_save_dir, html_save_dir, start_date, update_mode)
         
         self.use_cookies = use_cookies
         self.cookies_file = cookies_file
 
         options = ChromeOptions()
+        # Return from driver.get() once the DOM is ready rather than after every asset loads
+        options.page_load_strategy = 'eager'
         if headless:
             options.add_argument("--headless")
         if chrome_path:
@@ -525,7 +746,7 @@ class PremiumSubstackScraper(BaseSubstackScraper):
         # Use existing Chrome profile if specified
         if user_data_dir:
             options.add_argument(f"--user-data-dir={user_data_dir}")
-            print(f"Using existing Chrome profile from: {user_data_dir}")
+            logger.info(f"Using existing Chrome profile from: {user_data_dir}")
         
         # Add additional options for better compatibility
         options.add_argument("--no-sandbox")
@@ -537,10 +758,11 @@ class PremiumSubstackScraper(BaseSubstackScraper):
         if chrome_driver_path:
             service = Service(executable_path=chrome_driver_path)
         else:
+            from webdriver_manager.chrome import ChromeDriverManager
+
             # Install and get the correct driver path
             driver_path = ChromeDriverManager().install()
             # On ARM Macs, the actual executable might be in a subdirectory
-            import os
             import platform
             if platform.system() == "Darwin" and platform.machine() == "arm64":
                 # Check if we got the wrong file
@@ -559,14 +781,14 @@ class PremiumSubstackScraper(BaseSubstackScraper):
         # Try to load cookies first if using cookie auth
         if self.use_cookies and not user_data_dir:
             if self.load_cookies():
-                print("Successfully loaded cookies from previous session")
+                logger.info("Successfully loaded cookies from previous session")
                 # Verify the session is still valid
                 if not self.verify_session():
-                    print("Session expired, logging in again...")
+                    logger.info("Session expired, logging in again...")
                     self.login()
                     self.save_cookies()
             else:
-                print("No saved cookies found, performing fresh login...")
+                logger.info("No saved cookies found, performing fresh login...")
                 self.login()
                 self.save_cookies()
         elif not user_data_dir:
@@ -577,7 +799,7 @@ class PremiumSubstackScraper(BaseSubstackScraper):
         else:
             # Using existing Chrome profile, verify session
             if not self.verify_session():
-                print("Warning: Not logged in with the Chrome profile. Please login manually in Chrome first.")
+                logger.warning("Warning: Not logged in with the Chrome profile. Please login manually in Chrome first.")
 
     def save_cookies(self) -> None:
         """
@@ -587,9 +809,9 @@ class PremiumSubstackScraper(BaseSubstackScraper):
             cookies = self.driver.get_cookies()
             with open(self.cookies_file, 'wb') as f:
                 pickle.dump(cookies, f)
-            print(f"Cookies saved to {self.cookies_file}")
+            logger.info(f"Cookies saved to {self.cookies_file}")
         except Exception as e:
-            print(f"Error saving cookies: {e}")
+            logger.warning(f"Error saving cookies: {e}")
     
     def load_cookies(self) -> bool:
         """
@@ -617,20 +839,22 @@ class PremiumSubstackScraper(BaseSubstackScraper):
                 try:
                     self.driver.add_cookie(cookie)
                 except Exception as e:
-                    print(f"Warning: Could not add cookie {cookie.get('name', 'unknown')}: {e}")
+                    logger.warning(f"Warning: Could not add cookie {cookie.get('name', 'unknown')}: {e}")
             
             # Refresh to apply cookies
             self.driver.refresh()
             sleep(2)
             return True
         except Exception as e:
-            print(f"Error loading cookies: {e}")
+            logger.warning(f"Error loading cookies: {e}")
             return False
     
     def verify_session(self) -> bool:
         """
         Verify if the current session is logged in
         """
+        from selenium.webdriver.common.by import By
+
         try:
             self.driver.get("https://substack.com/account")
             sleep(3)
@@ -648,13 +872,15 @@ class PremiumSubstackScraper(BaseSubstackScraper):
             except:
                 return False
         except Exception as e:
-            print(f"Error verifying session: {e}")
+            logger.warning(f"Error verifying session: {e}")
             return False
     
     def login(self) -> None:
         """
         This method logs into Substack using Selenium
         """
+        from selenium.webdriver.common.by import By
+
         self.driver.get("https://substack.com/sign-in")
         sleep(3)
 
@@ -674,7 +900,7 @@ class PremiumSubstackScraper(BaseSubstackScraper):
         submit = self.driver.find_element(By.XPATH, "//*[@id=\"substack-login\"]/div[2]/div[2]/form/button")
         submit.click()
         
-        print("Waiting for login... (you have 2 minutes to complete captcha/2FA if needed)")
+        logger.info("Waiting for login... (you have 2 minutes to complete captcha/2FA if needed)")
         sleep(120)  # Wait up to 2 minutes for login, captcha, or 2FA
 
         if self.is_login_failed():
@@ -688,22 +914,43 @@ class PremiumSubstackScraper(BaseSubstackScraper):
         """
         Check for the presence of the 'error-container' to indicate a failed login attempt.
         """
+        from selenium.webdriver.common.by import By
+
         error_container = self.driver.find_elements(By.ID, 'error-container')
         return len(error_container) > 0 and error_container[0].is_displayed()
 
-    def get_url_soup(self, url: str) -> BeautifulSoup:
+    def get_url_tree(self, url: str) -> Optional[LexborHTMLParser]:
         """
-        Gets soup from URL using logged in selenium driver with polite delays
+        Gets parsed HTML tree from URL using logged in selenium driver with polite delays
         """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         try:
             self.driver.get(url)
-            # Add small delay to let page fully load
-            sleep(2)
-            return BeautifulSoup(self.driver.page_source, "html.parser")
+            # Wait until the post body (or paywall) is present instead of a fixed sleep
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.available-content, h2.paywall-title"))
+                )
+            except TimeoutException:
+                # Slow page or unusual layout: parse whatever has loaded, as before
+                pass
+            return LexborHTMLParser(self.driver.page_source)
         except Exception as e:
-            print(f"Error fetching page {url}: {e}")
+            logger.warning(f"Error fetching page {url}: {e}")
             return None
 
+    def close(self) -> None:
+        """Closes the HTTP client and quits the browser."""
+        super().close()
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
     def __del__(self):
         """Clean up the driver when the scraper is destroyed"""
         if hasattr(self, 'driver'):
@@ -764,7 +1011,7 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--start-date",
-        type=str,
+        type=iso_date,
         help="Only scrape posts from this date onwards (format: YYYY-MM-DD, e.g., 2024-01-01)",
     )
     parser.add_argument(